@@ -2,6 +2,7 @@
 from __future__ import annotations
 import streamlit as st
 import pandas as pd
+import numpy as np
 from zoneinfo import ZoneInfo
 import bcrypt
 import uuid
@@ -27,6 +28,13 @@ sp = get_supabase()
 # endregion
 
 # region data_loading
+def _parse_datum(col: pd.Series) -> pd.Series:
+    """Parst Supabase-Zeitstempel (ISO-8601, UTC) nach Europe/Berlin.
+    Festes Format statt Inferenz pro String; cache=True dedupliziert gleiche Werte.
+    """
+    return pd.to_datetime(col, errors="coerce", utc=True, format="ISO8601", cache=True).dt.tz_convert(TZ)
+
+
 @st.cache_data(ttl=30)
 def load_table(table_name: str) -> pd.DataFrame:
     """Lädt eine Supabase-Tabelle vollständig in ein DataFrame.
@@ -39,15 +47,47 @@ def load_table(table_name: str) -> pd.DataFrame:
         data = res.data or []
     except Exception:
         return pd.DataFrame()
+    return _table_frame(data)
+
+
+def _table_frame(data: list[dict]) -> pd.DataFrame:
+    """Gemeinsame Nachbearbeitung für load_table/load_pending (siehe Docstring load_table)."""
     df = pd.DataFrame(data)
     if df.empty:
         return df
     df.columns = [str(c).lower() for c in df.columns]
     if "datum" in df.columns:
-        df["datum"] = pd.to_datetime(df["datum"], errors="coerce", utc=True).dt.tz_convert(TZ)
+        df["datum"] = _parse_datum(df["datum"])
     return df
 
 
+# Spalten je Pending-Tabelle, über die ein Spieler beteiligt sein kann
+_PENDING_PLAYER_COLUMNS = {
+    "pending_matches": ("a", "b"),
+    "pending_doubles": ("a1", "a2", "b1", "b2"),
+}
+
+
+@st.cache_data(ttl=30)
+def load_pending(table_name: str, player_id: str) -> pd.DataFrame:
+    """Lädt nur die Pending-Zeilen, an denen `player_id` beteiligt ist (als Spieler oder Ersteller).
+    Gefiltert wird serverseitig per OR-Filter statt die ganze Tabelle zu laden.
+    Schlägt der Filter fehl (z. B. unbekannte Spalte), wird auf load_table zurückgefallen.
+    """
+    if table_name == "pending_rounds":
+        conds = [f"teilnehmer.like.*{player_id}*"]
+    else:
+        conds = [f"{c}.eq.{player_id}" for c in _PENDING_PLAYER_COLUMNS.get(table_name, ())]
+    if table_has_creator(table_name):
+        conds.append(f"creator.eq.{player_id}")
+    try:
+        res = sp.table(table_name).select("*").or_(",".join(conds)).execute()
+        data = res.data or []
+    except Exception:
+        return load_table(table_name)
+    return _table_frame(data)
+
+
 # region load_recent
 @st.cache_data(ttl=5)
 def load_recent(table_name: str, columns: list[str] | None = None, limit: int = 5) -> pd.DataFrame:
@@ -72,29 +112,73 @@ def load_recent(table_name: str, columns: list[str] | None = None, limit: int =
         return df
     df.columns = [str(c).lower() for c in df.columns]
     if "datum" in df.columns:
-        df["datum"] = pd.to_datetime(df["datum"], errors="coerce", utc=True).dt.tz_convert(TZ)
+        df["datum"] = _parse_datum(df["datum"])
     return df
 # endregion
 
-def clear_table_cache():
-    # Räumt alle relevanten Cachefunktionen auf, damit ein Refresh wirklich neue Daten holt
-    try:
-        load_table.clear()
-    except Exception:
-        pass
-    try:
-        load_recent.clear()
-    except Exception:
-        pass
-    try:
-        get_player_maps.clear()
-    except Exception:
-        pass
+def clear_table_cache(tables: tuple[str, ...] | None = None):
+    """Räumt die Cachefunktionen auf, damit ein Refresh wirklich neue Daten holt.
+    - Ohne `tables`: alles (Refresh, Bestätigungen, Spieleränderungen)
+    - Mit `tables`: nur die geschriebenen Tabellen; Spieler-Caches bleiben erhalten,
+      solange "players" nicht betroffen ist (z. B. Pending anlegen/ablehnen)
+    """
+    if tables is None:
+        try:
+            load_table.clear()
+        except Exception:
+            pass
+        try:
+            load_recent.clear()
+        except Exception:
+            pass
+        try:
+            load_recent_games.clear()
+        except Exception:
+            pass
+        try:
+            load_pending.clear()
+        except Exception:
+            pass
+        try:
+            get_player_maps.clear()
+        except Exception:
+            pass
+        try:
+            load_player.clear()
+        except Exception:
+            pass
+        return
+    for t in tables:
+        try:
+            load_table.clear(t)
+        except TypeError:
+            # Ältere Streamlit-Versionen kennen kein gezieltes clear(args) → alles leeren
+            clear_table_cache()
+            return
+        except Exception:
+            pass
+    if any(t.startswith("pending_") for t in tables):
+        try:
+            load_pending.clear()
+        except Exception:
+            pass
+    if "players" in tables:
+        try:
+            get_player_maps.clear()
+        except Exception:
+            pass
+        try:
+            load_player.clear()
+        except Exception:
+            pass
 # endregion
 
 # region auth_helpers
+# Für eine 4-stellige PIN bringt Cost 12 (bcrypt-Default) keine echte Sicherheit, kostet aber ~200 ms pro Prüfung
+PIN_BCRYPT_ROUNDS = 8
+
 def hash_pin(pin: str) -> str:
-    return bcrypt.hashpw(pin.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(pin.encode(), bcrypt.gensalt(rounds=PIN_BCRYPT_ROUNDS)).decode()
 
 def check_pin(entered: str, stored: str) -> bool:
     """Vergleicht eingegebene PIN mit gespeichertem Wert (unterstützt Legacy-Klartext)."""
@@ -152,14 +236,19 @@ def try_auto_login_from_query():
 
 # region player_helpers
 
+@st.cache_data(ttl=30)
+def load_player(pid: str) -> dict | None:
+    """Lädt einen Spieler-Datensatz aus Supabase (gecacht; wird über clear_table_cache invalidiert)."""
+    return sp.table("players").select("*").eq("id", pid).single().execute().data
+
+
 def get_current_user() -> dict | None:
-    """Lädt den aktuell eingeloggten Spieler-Datensatz frisch aus Supabase."""
+    """Lädt den aktuell eingeloggten Spieler-Datensatz (Cache statt Roundtrip bei jedem Rerun)."""
     try:
         pid = st.session_state.get("player_id")
         if not pid:
             return None
-        rec = sp.table("players").select("*").eq("id", pid).single().execute().data
-        return rec
+        return load_player(str(pid))
     except Exception:
         return None
 
@@ -169,10 +258,9 @@ def get_player_maps():
     df = load_table("players")
     id_to_name = {}
     name_to_id = {}
-    if not df.empty:
-        for _, r in df.iterrows():
-            pid = str(r.get("id"))
-            nm = str(r.get("name"))
+    if not df.empty and "id" in df.columns and "name" in df.columns:
+        # Spalten einmal extrahieren statt iterrows() – reine Dict-Lookups danach
+        for pid, nm in zip(df["id"].astype(str), df["name"].astype(str)):
             if pid and nm:
                 id_to_name[pid] = nm
                 name_to_id[nm] = pid
@@ -192,6 +280,7 @@ def table_has_creator(table: str) -> bool:
 
 # region game_helpers
 from datetime import datetime
+import math
 
 def _utc_iso(ts) -> str:
     ts = pd.Timestamp(ts)
@@ -220,15 +309,36 @@ def _compute_gelo_dynamic(elo:int, d_elo:int, r_elo:int, n_e:int, n_d:int, n_r:i
     return int(round(w_e*elo + w_d*d_elo + w_r*r_elo))
 
 
-def calc_elo(r_a: float, r_b: float, score_a: float, k: float = 64) -> int:
-    """ELO-Formel mit Erwartungswert; k wird außerhalb ggf. um Margenfaktor skaliert."""
-    exp_a = 1 / (1 + 10 ** ((r_b - r_a) / 400))
-    return int(round(r_a + k * (score_a - exp_a)))
+_LN10_400 = math.log(10) / 400
+
+# Erwartungswerte 1 / (1 + 10^(diff/400)) vorberechnet für |diff| <= 1000 in Halbpunkt-Schritten
+# (ELO wird ganzzahlig gespeichert; Doppel-Teamschnitte können auf .5 enden)
+_EXP_LUT_MAX = 1000
+_EXP_LUT = [1.0 / (1.0 + math.exp(_LN10_400 * (i / 2))) for i in range(-2 * _EXP_LUT_MAX, 2 * _EXP_LUT_MAX + 1)]
+
+
+def _expected_score(diff: float) -> float:
+    """Erwartungswert bei Ratingdifferenz `diff` (Gegner minus eigenes Rating).
+    Tabellen-Lookup für Halbpunkt-Differenzen im Bereich ±1000, sonst direkt berechnet.
+    """
+    i2 = 2 * diff
+    if -_EXP_LUT_MAX <= diff <= _EXP_LUT_MAX and i2 == int(i2):
+        return _EXP_LUT[int(i2) + 2 * _EXP_LUT_MAX]
+    return 1.0 / (1.0 + math.exp(_LN10_400 * diff))
+
+
+def calc_elo_pair(r_a: float, r_b: float, score_a: float, k: float = 64) -> tuple[float, float]:
+    """ELO-Update für beide Spieler in einem Schritt (Nullsumme: B verliert, was A gewinnt).
+    Gibt ungerundete Werte zurück; gerundet wird erst beim Speichern.
+    """
+    exp_a = _expected_score(r_b - r_a)
+    d = k * (score_a - exp_a)
+    return r_a + d, r_b - d
 
 
 def calc_doppel_elo(r1: float, r2: float, opp_avg: float, s: float, k: float = 48) -> tuple[int, int]:
     team_avg = (r1 + r2) / 2
-    exp = 1 / (1 + 10 ** ((opp_avg - team_avg) / 400))
+    exp = _expected_score(opp_avg - team_avg)
     delta = k * (s - exp)
     return int(round(r1 + delta)), int(round(r2 + delta))
 
@@ -237,11 +347,12 @@ def calc_doppel_elo(r1: float, r2: float, opp_avg: float, s: float, k: float = 4
 # Zero-sum group ELO for Rundlauf: winner=1.0, second=0.5, others=0.0
 # Ensures that the sum of rating changes across all participants is 0 (up to rounding; we correct drift).
 def _calc_round_group_deltas(ratings: dict[str, float], winner_id: str, fin1_id: str, fin2_id: str, k: int = 48) -> dict[str, int]:
-    import math
     # Total score mass to distribute: 1.0 (winner) + 0.5 (second) + 0 for others
     S_total = 1.5
     # Softmax (base 10) over current ratings → probabilities that sum to 1
-    pow_map = {pid: 10 ** (float(r) / 400.0) for pid, r in ratings.items()}
+    # (shifted by the max rating: same probabilities, but exp() stays in [0, 1])
+    r_max = max((float(r) for r in ratings.values()), default=0.0)
+    pow_map = {pid: math.exp(_LN10_400 * (float(r) - r_max)) for pid, r in ratings.items()}
     denom = sum(pow_map.values()) or 1.0
     # Expected share scaled to the total score mass
     exp = {pid: S_total * (pow_map[pid] / denom) for pid in ratings.keys()}
@@ -272,17 +383,18 @@ def _calc_round_group_deltas(ratings: dict[str, float], winner_id: str, fin1_id:
 # Hinweis: Die folgende Einzel-Funktion wird aktuell nicht mehr für Updates genutzt (ersetzt durch _calc_round_group_deltas).
 def calc_round_elo(r: float, avg: float, s: float, k: int = 48) -> int:
     """Rundlauf-ELO: Sieger=1, Zweiter=0.5, andere=0."""
-    exp = 1 / (1 + 10 ** ((avg - r) / 400))
+    exp = _expected_score(avg - r)
     return int(round(r + k * (s - exp)))
 
+def _fetch_players(ids: list[str], columns: str) -> dict[str, dict]:
+    """Lädt mehrere Spieler mit einer Abfrage (statt einer pro ID). Rückgabe: {id: Datensatz}."""
+    res = sp.table("players").select(columns).in_("id", [str(pid) for pid in ids]).execute()
+    return {str(rec.get("id")): rec for rec in (res.data or [])}
+
 def update_round_after_confirm_id(participant_ids: list[str], fin1_id: str, fin2_id: str, winner_id: str, k: int = 48) -> None:
     """Aktualisiert r_elo/Stats und g_elo aller Teilnehmer eines Rundlaufs (ID-basiert)."""
-    # 1) Aktuelle Werte holen
-    current = {}
-    for pid in participant_ids:
-        rec = sp.table("players").select("id, name, r_elo, r_siege, r_zweite, r_niederlagen, r_spiele, elo, spiele, d_spiele, d_elo").eq("id", pid).single().execute().data
-        if rec:
-            current[str(pid)] = rec
+    # 1) Aktuelle Werte holen (eine Abfrage für alle Teilnehmer)
+    current = _fetch_players(participant_ids, "id, name, r_elo, r_siege, r_zweite, r_niederlagen, r_spiele, elo, spiele, d_spiele, d_elo")
     if not current:
         return
 
@@ -325,28 +437,29 @@ def update_round_after_confirm_id(participant_ids: list[str], fin1_id: str, fin2
 
 
 def update_single_after_confirm_id(a_id: str, b_id: str, pa: int, pb: int, k_base: int = 64) -> None:
+    """Inkrementelles ELO-Update für genau ein bestätigtes Einzel (kein Replay aller Spiele)."""
     if int(pa) == int(pb):
         return
-    a = sp.table("players").select("id, elo, siege, niederlagen, spiele, d_spiele, r_spiele, d_elo, r_elo").eq("id", a_id).single().execute().data
-    b = sp.table("players").select("id, elo, siege, niederlagen, spiele, d_spiele, r_spiele, d_elo, r_elo").eq("id", b_id).single().execute().data
+    recs = _fetch_players([a_id, b_id], "id, elo, siege, niederlagen, spiele, d_spiele, r_spiele, d_elo, r_elo")
+    a, b = recs.get(str(a_id)), recs.get(str(b_id))
     if not a or not b:
         return
     r_a, r_b = float(a.get("elo", 1200)), float(b.get("elo", 1200))
     margin = abs(int(pa) - int(pb))  # 0–11
     k_eff = k_base * (1 + margin / 11)
-    winner_is_a = int(pa) > int(pb)
-    new_r_a = calc_elo(r_a, r_b, 1 if winner_is_a else 0, k_eff)
-    new_r_b = calc_elo(r_b, r_a, 0 if winner_is_a else 1, k_eff)
+    s_a = int(int(pa) > int(pb))  # 1 = Sieg A, 0 = Sieg B
+    s_b = 1 - s_a
+    new_r_a, new_r_b = calc_elo_pair(r_a, r_b, s_a, k_eff)
     a_payload = {
-        "elo": new_r_a,
-        "siege": int(a.get("siege", 0)) + (1 if winner_is_a else 0),
-        "niederlagen": int(a.get("niederlagen", 0)) + (0 if winner_is_a else 1),
+        "elo": int(round(new_r_a)),
+        "siege": int(a.get("siege", 0)) + s_a,
+        "niederlagen": int(a.get("niederlagen", 0)) + s_b,
         "spiele": int(a.get("spiele", 0)) + 1,
     }
     b_payload = {
-        "elo": new_r_b,
-        "siege": int(b.get("siege", 0)) + (0 if winner_is_a else 1),
-        "niederlagen": int(b.get("niederlagen", 0)) + (1 if winner_is_a else 0),
+        "elo": int(round(new_r_b)),
+        "siege": int(b.get("siege", 0)) + s_b,
+        "niederlagen": int(b.get("niederlagen", 0)) + s_a,
         "spiele": int(b.get("spiele", 0)) + 1,
     }
     a_payload["g_elo"] = _compute_gelo_dynamic(
@@ -372,10 +485,8 @@ def update_single_after_confirm_id(a_id: str, b_id: str, pa: int, pb: int, k_bas
 def update_double_after_confirm_id(a1_id: str, a2_id: str, b1_id: str, b2_id: str, pa: int, pb: int, k_base: int = 48) -> None:
     if int(pa) == int(pb):
         return
-    A1 = sp.table("players").select("id, d_elo, d_siege, d_niederlagen, d_spiele, elo, spiele, r_spiele, r_elo").eq("id", a1_id).single().execute().data
-    A2 = sp.table("players").select("id, d_elo, d_siege, d_niederlagen, d_spiele, elo, spiele, r_spiele, r_elo").eq("id", a2_id).single().execute().data
-    B1 = sp.table("players").select("id, d_elo, d_siege, d_niederlagen, d_spiele, elo, spiele, r_spiele, r_elo").eq("id", b1_id).single().execute().data
-    B2 = sp.table("players").select("id, d_elo, d_siege, d_niederlagen, d_spiele, elo, spiele, r_spiele, r_elo").eq("id", b2_id).single().execute().data
+    recs = _fetch_players([a1_id, a2_id, b1_id, b2_id], "id, d_elo, d_siege, d_niederlagen, d_spiele, elo, spiele, r_spiele, r_elo")
+    A1, A2, B1, B2 = (recs.get(str(pid)) for pid in (a1_id, a2_id, b1_id, b2_id))
     if not A1 or not A2 or not B1 or not B2:
         return
     ra1, ra2 = float(A1.get("d_elo", 1200)), float(A2.get("d_elo", 1200))
@@ -383,7 +494,7 @@ def update_double_after_confirm_id(a1_id: str, a2_id: str, b1_id: str, b2_id: st
     a_avg, b_avg = (ra1 + ra2) / 2, (rb1 + rb2) / 2
     margin = abs(int(pa) - int(pb))
     k_eff = k_base * (1 + margin / 11)
-    team_a_win = 1 if int(pa) > int(pb) else 0
+    team_a_win = int(int(pa) > int(pb))
     nr1, nr2 = calc_doppel_elo(ra1, ra2, b_avg, team_a_win, k_eff)
     nr3, nr4 = calc_doppel_elo(rb1, rb2, a_avg, 1 - team_a_win, k_eff)
     updates = [
@@ -429,26 +540,19 @@ def create_pending_single(creator_id: str, opponent_id: str, s_a: int, s_b: int,
     sp.table("pending_matches").insert(payload).execute()
 
 
-def create_pending_double(creator_id: str, partner_id: str, opp1_id: str, opp2_id: str, team_a_is_creator: bool = True):
-    """Erstellt ein Doppel-Pending.
-    - team_a_is_creator=True: Team A = (creator_id, partner_id)
-    - team_a_is_creator=False: Team A = (partner_id, opp1_id) und Team B = (opp2_id, creator_id) wird NICHT automatisch gesetzt; stattdessen erstellt der Ersteller nur für andere (A=partner_id+opp1_id, B=opp2_id+<zweiter Gegner>). In diesem Fall muss partner_id bereits beide Team-A-Spieler enthalten, daher verwenden wir partner_id als A2 und erwarten, dass opp1_id/opp2_id die Team‑B‑Spieler sind.
+def create_pending_double(creator_id: str, a1_id: str, a2_id: str, b1_id: str, b2_id: str, s_a: int, s_b: int):
+    """Erstellt ein Doppel-Pending (Team A = a1/a2, Team B = b1/b2) mit einem einzelnen Insert.
+    Der Ersteller muss nicht mitspielen.
     """
-    if team_a_is_creator:
-        a1, a2, b1, b2 = creator_id, partner_id, opp1_id, opp2_id
-    else:
-        # Ersteller spielt nicht mit → A = (partner_id, opp1_id), B = (opp2_id, irgendein anderer). Für UI-Varianten bauen wir unten einen zweiten Aufruf.
-        a1, a2, b1, b2 = partner_id, opp1_id, opp2_id, None  # b2 wird in der UI-Logik gesetzt
     payload = {
         "datum": _utc_iso(pd.Timestamp.now(tz=TZ)),
-        "a1": a1, "a2": a2, "b1": b1, "b2": b2,
-        "punktea": 0, "punkteb": 0,  # Scores werden aus der UI-Variante gesetzt
+        "a1": a1_id, "a2": a2_id, "b1": b1_id, "b2": b2_id,
+        "punktea": int(s_a), "punkteb": int(s_b),
         "confa": False, "confb": False,
     }
     if table_has_creator("pending_doubles"):
         payload["creator"] = creator_id
-    # Insert erfolgt in der UI mit finalen Werten (wir überschreiben punktea/punkteb/b2 dort vor dem Insert)
-    return payload
+    sp.table("pending_doubles").insert(payload).execute()
 
 
 def create_pending_round(creator_id: str, participant_ids: list[str], fin1_id: str, fin2_id: str, winner_id: str):
@@ -639,6 +743,46 @@ try_auto_login_from_query()
 
 # region ui_logged_in
 
+# Statische Styles einmal auf Modulebene statt pro Rerun neu aufzubauen
+_ELO_HEADER_CSS = """
+        <style>
+        .elo-wrap { margin: 0.25rem 0 0.5rem; }
+        .welcome { font-size: 1.25rem; font-weight: 600; margin: 0 0 .25rem; }
+        .elo-center { text-align: center; margin: .25rem 0 .5rem; }
+        .elo-center .value { font-size: 40px; font-weight: 700; line-height: 1; }
+        .elo-grid { display: flex; gap: 8px; justify-content: center; align-items: stretch; flex-wrap: nowrap; }
+        .elo-card { flex: 0 1 33%; max-width: 33%; padding: 8px 10px; border: 1px solid rgba(255,255,255,.15); border-radius: 10px; text-align: center; backdrop-filter: blur(2px); }
+        .elo-card .label { font-size: 12px; opacity: .75; margin-bottom: 2px; }
+        .elo-card .value { font-size: 18px; font-weight: 600; line-height: 1.1; }
+        @media (max-width: 480px) {
+          .elo-center .value { font-size: 34px; }
+          .elo-grid { gap: 6px; }
+          .elo-card { padding: 6px 6px; }
+          .elo-card .value { font-size: 16px; }
+        }
+        </style>
+"""
+
+# Index-Spalte praktisch unsichtbar machen: minimale Breite und transparente Farbe
+_HIDDEN_INDEX_STYLES = [
+    {"selector": "th.row_heading", "props": [
+        ("width","1px"),("min-width","1px"),("max-width","1px"),
+        ("padding","0"),("border","none"),("overflow","hidden"),
+        ("color","transparent")
+    ]},
+    {"selector": "tbody th", "props": [
+        ("width","1px"),("min-width","1px"),("max-width","1px"),
+        ("padding","0"),("border","none"),("overflow","hidden"),
+        ("color","transparent")
+    ]},
+    {"selector": "th.blank", "props": [
+        ("width","1px"),("min-width","1px"),("max-width","1px"),
+        ("padding","0"),("border","none"),("overflow","hidden"),
+        ("color","transparent")
+    ]},
+]
+
+
 def _metric_val(user: dict, key: str, default: int = 1200) -> int:
     try:
         return int(user.get(key, default))
@@ -653,23 +797,7 @@ def logged_in_header(user: dict):
     r_elo = _metric_val(user, 'r_elo')
 
     st.markdown(
-        f"""
-        <style>
-        .elo-wrap {{ margin: 0.25rem 0 0.5rem; }}
-        .welcome {{ font-size: 1.25rem; font-weight: 600; margin: 0 0 .25rem; }}
-        .elo-center {{ text-align: center; margin: .25rem 0 .5rem; }}
-        .elo-center .value {{ font-size: 40px; font-weight: 700; line-height: 1; }}
-        .elo-grid {{ display: flex; gap: 8px; justify-content: center; align-items: stretch; flex-wrap: nowrap; }}
-        .elo-card {{ flex: 0 1 33%; max-width: 33%; padding: 8px 10px; border: 1px solid rgba(255,255,255,.15); border-radius: 10px; text-align: center; backdrop-filter: blur(2px); }}
-        .elo-card .label {{ font-size: 12px; opacity: .75; margin-bottom: 2px; }}
-        .elo-card .value {{ font-size: 18px; font-weight: 600; line-height: 1.1; }}
-        @media (max-width: 480px) {{
-          .elo-center .value {{ font-size: 34px; }}
-          .elo-grid {{ gap: 6px; }}
-          .elo-card {{ padding: 6px 6px; }}
-          .elo-card .value {{ font-size: 16px; }}
-        }}
-        </style>
+        _ELO_HEADER_CSS + f"""
         <div class="elo-wrap">
           <div class="welcome">Willkommen, {name}</div>
           <div class="elo-center"><div class="value">{gelo}</div></div>
@@ -737,6 +865,120 @@ def render_double_vs_card(r: pd.Series, id_to_name: dict, *, highlight_name: str
 
 
 
+@st.cache_data(ttl=5)
+def load_recent_games(id_to_name: dict, limit: int = 5) -> pd.DataFrame:
+    """Baut die Tabelle "Letzte Spiele" (Modus, Teilnehmer, Ergebnis) über alle Modi.
+    Gecacht wie load_recent, damit nicht jeder Rerun Zeilen, Sortierung und Namen neu aufbaut.
+    """
+    m = load_recent("matches", columns=["datum","a","b","punktea","punkteb"], limit=limit)
+    d = load_recent("doubles", columns=["datum","a1","a2","b1","b2","punktea","punkteb"], limit=limit)
+    r = load_recent("rounds",  columns=["datum","teilnehmer","finalisten","sieger"], limit=limit)
+    rows = []
+    # Einzel
+    if not m.empty:
+        for x in m.to_dict("records"):
+            a_n = id_to_name.get(str(x.get("a")), str(x.get("a")))
+            b_n = id_to_name.get(str(x.get("b")), str(x.get("b")))
+            rows.append({
+                "datum": x.get("datum"),
+                "Modus": "Einzel",
+                "Teilnehmer": f"{a_n} vs {b_n}",
+                "Ergebnis": f"{int(x.get('punktea',0))}:{int(x.get('punkteb',0))}",
+            })
+    # Doppel
+    if not d.empty:
+        for x in d.to_dict("records"):
+            a1 = id_to_name.get(str(x.get("a1")), str(x.get("a1")))
+            a2 = id_to_name.get(str(x.get("a2")), str(x.get("a2")))
+            b1 = id_to_name.get(str(x.get("b1")), str(x.get("b1")))
+            b2 = id_to_name.get(str(x.get("b2")), str(x.get("b2")))
+            rows.append({
+                "datum": x.get("datum"),
+                "Modus": "Doppel",
+                "Teilnehmer": f"{a1}/{a2} vs {b1}/{b2}",
+                "Ergebnis": f"{int(x.get('punktea',0))}:{int(x.get('punkteb',0))}",
+            })
+    # Rundlauf
+    if not r.empty:
+        for x in r.to_dict("records"):
+            teiln = [id_to_name.get(pid, pid) for pid in str(x.get("teilnehmer") or "").split(";") if pid]
+            fin_list = [id_to_name.get(pid, pid) for pid in str(x.get("finalisten") or "").split(";") if pid]
+            winner_n = id_to_name.get(str(x.get("sieger")), str(x.get("sieger")))
+            second_n = fin_list[1] if len(fin_list)>1 and fin_list[0]==winner_n else (fin_list[0] if len(fin_list)>0 else '-')
+            rows.append({
+                "datum": x.get("datum"),
+                "Modus": "Rundlauf",
+                "Teilnehmer": ", ".join(teiln),
+                "Ergebnis": f"1.: {winner_n}\n2.: {second_n}",
+            })
+    if not rows:
+        return pd.DataFrame()
+    df_last = pd.DataFrame(rows)
+    # Zeitlich streng nach Spiel‑Zeitpunkt sortieren (UTC‑normalisiert)
+    df_last["sort_ts"] = pd.to_datetime(df_last["datum"], errors="coerce", utc=True)
+    df_last = df_last.sort_values("sort_ts", ascending=False, na_position="last").head(limit)
+    return df_last[["Modus","Teilnehmer","Ergebnis"]]
+
+
+def collect_pending(me) -> tuple[list, list, list, list, list, list]:
+    """Lädt die Pending-Zeilen von `me` (serverseitig gefiltert) und baut in einem Durchlauf den Index:
+    - zu bestätigen: Teilnehmer, aber nicht Ersteller
+    - von mir erstellt: kann ich abbrechen
+    Wird einmal pro Rerun aufgerufen und von Übersicht- und Spielen-Tab gemeinsam genutzt.
+    Rückgabe: (info_rows_s, info_rows_d, info_rows_r, mine_s, mine_d, mine_r)
+    """
+    pm = load_pending("pending_matches", str(me))
+    pdbl = load_pending("pending_doubles", str(me))
+    pr = load_pending("pending_rounds", str(me))
+
+    # --- Meine offenen Bestätigungen sammeln (pro Modus) ---
+    # ID-Spalten einmal als String-Arrays lesen, Masken mit NumPy; Auswahl per iloc mit Positionsindex (np.flatnonzero)
+    me_s = str(me)
+    info_rows_s, info_rows_d, info_rows_r = [], [], []
+    mine_s, mine_d, mine_r = [], [], []
+    # Einzel
+    if not pm.empty:
+        a, b = pm["a"].astype(str).to_numpy(), pm["b"].astype(str).to_numpy()
+        if table_has_creator("pending_matches"):
+            c = pm["creator"].astype(str).to_numpy()
+            conf_mask = ((a == me_s) | (b == me_s)) & (c != me_s)
+            mine_mask = c == me_s
+        else:
+            conf_mask = b == me_s
+            mine_mask = a == me_s
+        info_rows_s = [r for _, r in pm.iloc[np.flatnonzero(conf_mask)].iterrows()]
+        mine_s = [r for _, r in pm.iloc[np.flatnonzero(mine_mask)].iterrows()]
+    # Doppel
+    if not pdbl.empty:
+        a1, a2, b1, b2 = (pdbl[col].astype(str).to_numpy() for col in ("a1", "a2", "b1", "b2"))
+        if table_has_creator("pending_doubles"):
+            c = pdbl["creator"].astype(str).to_numpy()
+            part_mask = (a1 == me_s) | (a2 == me_s) | (b1 == me_s) | (b2 == me_s)
+            conf_mask = part_mask & (c != me_s)
+            mine_mask = c == me_s
+        else:
+            conf_mask = (a1 != me_s) & ((a2 == me_s) | (b1 == me_s) | (b2 == me_s))
+            mine_mask = a1 == me_s
+        info_rows_d = [r for _, r in pdbl.iloc[np.flatnonzero(conf_mask)].iterrows()]
+        mine_d = [r for _, r in pdbl.iloc[np.flatnonzero(mine_mask)].iterrows()]
+    # Rundlauf
+    if not pr.empty:
+        teiln_lists = [[x for x in str(t).split(";") if x] for t in pr["teilnehmer"].to_numpy(dtype=object)]
+        involved = np.fromiter((me_s in teiln for teiln in teiln_lists), dtype=bool, count=len(teiln_lists))
+        if table_has_creator("pending_rounds"):
+            c = pr["creator"].astype(str).to_numpy()
+            conf_mask = involved & (c != me_s)
+            mine_mask = c == me_s
+        else:
+            # Ohne creator-Spalte gilt der erste Teilnehmer als Ersteller
+            first = np.fromiter((len(teiln) > 0 and teiln[0] == me_s for teiln in teiln_lists), dtype=bool, count=len(teiln_lists))
+            conf_mask = involved & ~first
+            mine_mask = first
+        info_rows_r = [r for _, r in pr.iloc[np.flatnonzero(conf_mask)].iterrows()]
+        mine_r = [r for _, r in pr.iloc[np.flatnonzero(mine_mask)].iterrows()]
+    return info_rows_s, info_rows_d, info_rows_r, mine_s, mine_d, mine_r
+
+
 def logged_in_ui():
     user = get_current_user()
     if not user:
@@ -767,46 +1009,7 @@ def logged_in_ui():
                     clear_table_cache()
                     st.rerun()
             
-            pm = load_table("pending_matches")
-            pdbl = load_table("pending_doubles")
-            pr = load_table("pending_rounds")
-
-            # --- Meine offenen Bestätigungen sammeln (pro Modus) ---
-            info_rows_s, info_rows_d, info_rows_r = [], [], []
-            # Einzel
-            if not pm.empty:
-                has_c = table_has_creator("pending_matches")
-                if has_c:
-                    my_conf_s = pm[(pm["a"].astype(str).eq(str(me)) | pm["b"].astype(str).eq(str(me))) & (pm["creator"].astype(str) != str(me))]
-                else:
-                    my_conf_s = pm[pm["b"].astype(str) == str(me)]
-                for _, r in my_conf_s.iterrows():
-                    info_rows_s.append(r)
-            # Doppel
-            if not pdbl.empty:
-                has_c_d = table_has_creator("pending_doubles")
-                if has_c_d:
-                    part_mask = (pdbl[["a1","a2","b1","b2"]].astype(str) == str(me)).any(axis=1)
-                    my_conf_d = pdbl[part_mask & (pdbl["creator"].astype(str) != str(me))]
-                else:
-                    my_conf_d = pdbl[(pdbl["a1"].astype(str) != str(me)) & ((pdbl["a2"].astype(str) == str(me)) | (pdbl["b1"].astype(str) == str(me)) | (pdbl["b2"].astype(str) == str(me)))]
-                for _, r in my_conf_d.iterrows():
-                    info_rows_d.append(r)
-            # Rundlauf
-            if not pr.empty:
-                has_c_r = table_has_creator("pending_rounds")
-                if has_c_r:
-                    def _involved_not_creator(row):
-                        teiln = [x for x in str(row.get("teilnehmer","")) .split(";") if x]
-                        return (str(me) in teiln) and (str(row.get("creator")) != str(me))
-                    my_conf_r = pr[pr.apply(_involved_not_creator, axis=1)]
-                else:
-                    def _is_involved_not_creator(row):
-                        teiln = [x for x in str(row.get("teilnehmer","")) .split(";") if x]
-                        return (str(me) in teiln) and (len(teiln) > 0 and teiln[0] != str(me))
-                    my_conf_r = pr[pr.apply(_is_involved_not_creator, axis=1)]
-                for _, r in my_conf_r.iterrows():
-                    info_rows_r.append(r)
+            info_rows_s, info_rows_d, info_rows_r, mine_s, mine_d, mine_r = collect_pending(me)
 
             # --- Global: Alle bestätigen (unter dem Refresh-Button) ---
             if any([info_rows_s, info_rows_d, info_rows_r]):
@@ -838,7 +1041,7 @@ def logged_in_ui():
                     r, id_to_name,
                     highlight_name=me_name,
                     key=f"trej_s_{r['id']}_ovw",
-                    on_reject=lambda rid: (reject_pending("pending_matches", rid), clear_table_cache(), st.rerun()),
+                    on_reject=lambda rid: (reject_pending("pending_matches", rid), clear_table_cache(("pending_matches",)), st.rerun()),
                     button_label="❌ Ablehnen",
                 )
 
@@ -849,7 +1052,7 @@ def logged_in_ui():
                     r, id_to_name,
                     highlight_name=me_name,
                     key=f"trej_d_{r['id']}_ovw",
-                    on_reject=lambda rid: (reject_pending("pending_doubles", rid), clear_table_cache(), st.rerun()),
+                    on_reject=lambda rid: (reject_pending("pending_doubles", rid), clear_table_cache(("pending_doubles",)), st.rerun()),
                     button_label="❌ Ablehnen",
                 )
 
@@ -860,7 +1063,7 @@ def logged_in_ui():
                     r, id_to_name,
                     highlight_name=me_name,
                     key=f"trej_r_{r['id']}_ovw",
-                    on_reject=lambda rid: (reject_pending("pending_rounds", rid), clear_table_cache(), st.rerun()),
+                    on_reject=lambda rid: (reject_pending("pending_rounds", rid), clear_table_cache(("pending_rounds",)), st.rerun()),
                     button_label="❌ Ablehnen",
                 )
 
@@ -876,10 +1079,12 @@ def logged_in_ui():
                 if df_players.empty or col not in df_players.columns:
                     st.info("Noch keine Daten.")
                     return
-                tmp = df_players[["name", col]].copy()
-                tmp[col] = pd.to_numeric(tmp[col], errors="coerce").fillna(0).astype(int)
-                tmp = tmp.sort_values(col, ascending=False).reset_index(drop=True)
-                tmp = tmp.rename(columns={"name": "Name", col: title})
+                # Anzeige-Frame in einem Schritt bauen (statt copy → Spalte setzen → rename)
+                tmp = pd.DataFrame({
+                    "Name": df_players["name"].to_numpy(),
+                    title: pd.to_numeric(df_players[col], errors="coerce").fillna(0).astype(int).to_numpy(),
+                })
+                tmp = tmp.sort_values(title, ascending=False, ignore_index=True)
 
                 # Index praktisch unsichtbar machen: minimale Breite via Styler und transparente Farbe
                 primary = st.get_option("theme.primaryColor") or "#dc2626"
@@ -897,21 +1102,7 @@ def logged_in_ui():
                     except Exception:
                         pass
                 sty = sty.set_table_styles([
-                    {"selector": "th.row_heading", "props": [
-                        ("width","1px"),("min-width","1px"),("max-width","1px"),
-                        ("padding","0"),("border","none"),("overflow","hidden"),
-                        ("color","transparent")
-                    ]},
-                    {"selector": "tbody th", "props": [
-                        ("width","1px"),("min-width","1px"),("max-width","1px"),
-                        ("padding","0"),("border","none"),("overflow","hidden"),
-                        ("color","transparent")
-                    ]},
-                    {"selector": "th.blank", "props": [
-                        ("width","1px"),("min-width","1px"),("max-width","1px"),
-                        ("padding","0"),("border","none"),("overflow","hidden"),
-                        ("color","transparent")
-                    ]},
+                    *_HIDDEN_INDEX_STYLES,
                     {"selector": "thead th", "props": [
                         ("text-align","center !important")
                     ]},
@@ -938,53 +1129,8 @@ def logged_in_ui():
                 _show_lb(players_df, "r_elo", "Rundlauf‑ELO", me_name)
 
             with lb_tabs[4]:  # Letzte Spiele
-                m = load_recent("matches", columns=["datum","a","b","punktea","punkteb"], limit=5)
-                d = load_recent("doubles", columns=["datum","a1","a2","b1","b2","punktea","punkteb"], limit=5)
-                r = load_recent("rounds",  columns=["datum","teilnehmer","finalisten","sieger"], limit=5)
-                rows = []
-                # Einzel
-                if not m.empty:
-                    for _, x in m.iterrows():
-                        a_n = id_to_name.get(str(x.get("a")), str(x.get("a")))
-                        b_n = id_to_name.get(str(x.get("b")), str(x.get("b")))
-                        rows.append({
-                            "datum": x.get("datum"),
-                            "Modus": "Einzel",
-                            "Teilnehmer": f"{a_n} vs {b_n}",
-                            "Ergebnis": f"{int(x.get('punktea',0))}:{int(x.get('punkteb',0))}",
-                        })
-                # Doppel
-                if not d.empty:
-                    for _, x in d.iterrows():
-                        a1 = id_to_name.get(str(x.get("a1")), str(x.get("a1")))
-                        a2 = id_to_name.get(str(x.get("a2")), str(x.get("a2")))
-                        b1 = id_to_name.get(str(x.get("b1")), str(x.get("b1")))
-                        b2 = id_to_name.get(str(x.get("b2")), str(x.get("b2")))
-                        rows.append({
-                            "datum": x.get("datum"),
-                            "Modus": "Doppel",
-                            "Teilnehmer": f"{a1}/{a2} vs {b1}/{b2}",
-                            "Ergebnis": f"{int(x.get('punktea',0))}:{int(x.get('punkteb',0))}",
-                        })
-                # Rundlauf
-                if not r.empty:
-                    for _, x in r.iterrows():
-                        teiln = [id_to_name.get(pid, pid) for pid in str(x.get("teilnehmer") or "").split(";") if pid]
-                        fin_list = [id_to_name.get(pid, pid) for pid in str(x.get("finalisten") or "").split(";") if pid]
-                        winner_n = id_to_name.get(str(x.get("sieger")), str(x.get("sieger")))
-                        second_n = fin_list[1] if len(fin_list)>1 and fin_list[0]==winner_n else (fin_list[0] if len(fin_list)>0 else '-')
-                        rows.append({
-                            "datum": x.get("datum"),
-                            "Modus": "Rundlauf",
-                            "Teilnehmer": ", ".join(teiln),
-                            "Ergebnis": f"1.: {winner_n}\n2.: {second_n}",
-                        })
-                if rows:
-                    df_last = pd.DataFrame(rows)
-                    # Zeitlich streng nach Spiel‑Zeitpunkt sortieren (UTC‑normalisiert)
-                    df_last["sort_ts"] = pd.to_datetime(df_last["datum"], errors="coerce", utc=True)
-                    df_last = df_last.sort_values("sort_ts", ascending=False, na_position="last").head(5)
-                    show_df = df_last[["Modus","Teilnehmer","Ergebnis"]].copy()
+                show_df = load_recent_games(id_to_name)
+                if not show_df.empty:
                     primary = st.get_option("theme.primaryColor") or "#dc2626"
 
                     def _style_last(row: pd.Series):
@@ -1001,21 +1147,7 @@ def logged_in_ui():
                     except Exception:
                         pass
                     sty = sty.set_table_styles([
-                        {"selector": "th.row_heading", "props": [
-                            ("width","1px"),("min-width","1px"),("max-width","1px"),
-                            ("padding","0"),("border","none"),("overflow","hidden"),
-                            ("color","transparent")
-                        ]},
-                        {"selector": "tbody th", "props": [
-                            ("width","1px"),("min-width","1px"),("max-width","1px"),
-                            ("padding","0"),("border","none"),("overflow","hidden"),
-                            ("color","transparent")
-                        ]},
-                        {"selector": "th.blank", "props": [
-                            ("width","1px"),("min-width","1px"),("max-width","1px"),
-                            ("padding","0"),("border","none"),("overflow","hidden"),
-                            ("color","transparent")
-                        ]},
+                        *_HIDDEN_INDEX_STYLES,
                         {"selector": "th.col_heading", "props": [
                             ("white-space","nowrap"), ("text-align","left")
                         ]},
@@ -1030,6 +1162,9 @@ def logged_in_ui():
             id_to_name, name_to_id = get_player_maps()
             me = st.session_state.get("player_id")
 
+            # Namen einmal sortieren; die Auswahllisten unten filtern nur noch (Reihenfolge bleibt erhalten)
+            all_names = sorted(name_to_id)
+
             # --- Erstellung: Modus per Tabs ---
             m_tabs = st.tabs(["Einzel", "Doppel", "Rundlauf"]) 
 
@@ -1037,24 +1172,24 @@ def logged_in_ui():
             with m_tabs[0]:
                 play_myself = st.checkbox("Ich spiele mit", value=True, help="Dein Name als Teilnehmer A. Deaktiviere, um ein Match für andere anzulegen.")
                 if play_myself:
-                    opponent = st.selectbox("Gegner", sorted([n for n in name_to_id.keys() if name_to_id[n] != me]), key="einzel_opponent")
+                    opponent = st.selectbox("Gegner", [n for n in all_names if name_to_id[n] != me], key="einzel_opponent")
                     c1, c2 = st.columns(2)
                     s_a = c1.number_input("Deine Punkte", min_value=0, step=1, value=11, key="einzel_s_a")
                     s_b = c2.number_input("Gegner Punkte", min_value=0, step=1, value=9, key="einzel_s_b")
                     if st.button("✅", key="btn_send_single_me"):
                         create_pending_single(me, name_to_id[opponent], s_a, s_b)
-                        clear_table_cache()
+                        clear_table_cache(("pending_matches",))
                         st.success("Einzel erstellt. Ein Teilnehmer muss bestätigen.")
                         st.rerun()
                 else:
-                    a_player = st.selectbox("Spieler A", sorted(list(name_to_id.keys())), key="einzel_a")
-                    b_player = st.selectbox("Spieler B", sorted([n for n in name_to_id.keys() if n != a_player]), key="einzel_b")
+                    a_player = st.selectbox("Spieler A", all_names, key="einzel_a")
+                    b_player = st.selectbox("Spieler B", [n for n in all_names if n != a_player], key="einzel_b")
                     c1, c2 = st.columns(2)
                     s_a = c1.number_input("Punkte A", min_value=0, step=1, value=11, key="einzel2_s_a")
                     s_b = c2.number_input("Punkte B", min_value=0, step=1, value=9, key="einzel2_s_b")
                     if st.button("✅", key="btn_send_single_others"):
                         create_pending_single(me, name_to_id[b_player], s_a, s_b, a_id=name_to_id[a_player])
-                        clear_table_cache()
+                        clear_table_cache(("pending_matches",))
                         st.success("Einzel erstellt. Ein Teilnehmer muss bestätigen.")
                         st.rerun()
 
@@ -1062,52 +1197,35 @@ def logged_in_ui():
             with m_tabs[1]:
                 play_myself_d = st.checkbox("Ich spiele mit", value=True, key="doppel_play_myself")
                 if play_myself_d:
-                    partner = st.selectbox("Partner", sorted([n for n in name_to_id.keys() if name_to_id[n] != me]), key="d_partner")
-                    right1 = st.selectbox("Gegner 1", sorted([n for n in name_to_id.keys() if name_to_id[n] not in (me, name_to_id[partner])]), key="d_opp1")
-                    right2 = st.selectbox("Gegner 2", sorted([n for n in name_to_id.keys() if name_to_id[n] not in (me, name_to_id[partner], name_to_id[right1])]), key="d_opp2")
+                    partner = st.selectbox("Partner", [n for n in all_names if name_to_id[n] != me], key="d_partner")
+                    right1 = st.selectbox("Gegner 1", [n for n in all_names if name_to_id[n] not in (me, name_to_id[partner])], key="d_opp1")
+                    right2 = st.selectbox("Gegner 2", [n for n in all_names if name_to_id[n] not in (me, name_to_id[partner], name_to_id[right1])], key="d_opp2")
                     c1, c2 = st.columns(2)
                     s_a = c1.number_input("Eure Punkte", min_value=0, step=1, value=11, key="d_s_a")
                     s_b = c2.number_input("Gegner Punkte", min_value=0, step=1, value=8, key="d_s_b")
                     if st.button("✅", key="btn_send_double_me"):
-                        # Direktes Insert mit fertigem Payload
-                        payload = {
-                            "datum": _utc_iso(pd.Timestamp.now(tz=TZ)),
-                            "a1": me, "a2": name_to_id[partner], "b1": name_to_id[right1], "b2": name_to_id[right2],
-                            "punktea": int(s_a), "punkteb": int(s_b),
-                            "confa": False, "confb": False,
-                        }
-                        if table_has_creator("pending_doubles"):
-                            payload["creator"] = me
-                        sp.table("pending_doubles").insert(payload).execute()
-                        clear_table_cache()
+                        create_pending_double(me, me, name_to_id[partner], name_to_id[right1], name_to_id[right2], s_a, s_b)
+                        clear_table_cache(("pending_doubles",))
                         st.success("Doppel erstellt. Ein Teilnehmer muss bestätigen.")
                         st.rerun()
                 else:
-                    a1 = st.selectbox("Spieler A1", sorted(list(name_to_id.keys())), key="d_a1")
-                    a2 = st.selectbox("Spieler A2", sorted([n for n in name_to_id.keys() if n != a1]), key="d_a2")
-                    b1 = st.selectbox("Spieler B1", sorted([n for n in name_to_id.keys() if n not in (a1, a2)]), key="d_b1")
-                    b2 = st.selectbox("Spieler B2", sorted([n for n in name_to_id.keys() if n not in (a1, a2, b1)]), key="d_b2")
+                    a1 = st.selectbox("Spieler A1", all_names, key="d_a1")
+                    a2 = st.selectbox("Spieler A2", [n for n in all_names if n != a1], key="d_a2")
+                    b1 = st.selectbox("Spieler B1", [n for n in all_names if n not in (a1, a2)], key="d_b1")
+                    b2 = st.selectbox("Spieler B2", [n for n in all_names if n not in (a1, a2, b1)], key="d_b2")
                     c1, c2 = st.columns(2)
                     s_a = c1.number_input("Punkte Team A", min_value=0, step=1, value=11, key="d2_s_a")
                     s_b = c2.number_input("Punkte Team B", min_value=0, step=1, value=8, key="d2_s_b")
                     if st.button("✅", key="btn_send_double_others"):
-                        payload = {
-                            "datum": _utc_iso(pd.Timestamp.now(tz=TZ)),
-                            "a1": name_to_id[a1], "a2": name_to_id[a2], "b1": name_to_id[b1], "b2": name_to_id[b2],
-                            "punktea": int(s_a), "punkteb": int(s_b),
-                            "confa": False, "confb": False,
-                        }
-                        if table_has_creator("pending_doubles"):
-                            payload["creator"] = me
-                        sp.table("pending_doubles").insert(payload).execute()
-                        clear_table_cache()
+                        create_pending_double(me, name_to_id[a1], name_to_id[a2], name_to_id[b1], name_to_id[b2], s_a, s_b)
+                        clear_table_cache(("pending_doubles",))
                         st.success("Doppel erstellt. Ein Teilnehmer muss bestätigen.")
                         st.rerun()
 
             # Rundlauf
             with m_tabs[2]:
                 play_myself_r = st.checkbox("Ich spiele mit", value=True, key="round_play_myself")
-                selectable = sorted(list(name_to_id.keys()))
+                selectable = all_names
                 default_sel = []
                 if play_myself_r and st.session_state.get("player_name") in selectable:
                     default_sel = [st.session_state.get("player_name")]
@@ -1134,7 +1252,7 @@ def logged_in_ui():
                             fin2_id=name_to_id[second_name],
                             winner_id=name_to_id[winner_name],
                         )
-                        clear_table_cache()
+                        clear_table_cache(("pending_rounds",))
                         st.success("Rundlauf erstellt (mit Sieger/Zweiter). Ein Teilnehmer muss bestätigen.")
                         st.rerun()
 
@@ -1149,46 +1267,7 @@ def logged_in_ui():
                 clear_table_cache()
                 st.rerun()
                 # Refresh nur für die Pending-Listen
-        pm = load_table("pending_matches")
-        pdbl = load_table("pending_doubles")
-        pr = load_table("pending_rounds")
-
-        # --- Meine offenen Bestätigungen sammeln (pro Modus) ---
-        info_rows_s, info_rows_d, info_rows_r = [], [], []
-        # Einzel
-        if not pm.empty:
-            has_c = table_has_creator("pending_matches")
-            if has_c:
-                my_conf_s = pm[(pm["a"].astype(str).eq(str(me)) | pm["b"].astype(str).eq(str(me))) & (pm["creator"].astype(str) != str(me))]
-            else:
-                my_conf_s = pm[pm["b"].astype(str) == str(me)]
-            for _, r in my_conf_s.iterrows():
-                info_rows_s.append(r)
-        # Doppel
-        if not pdbl.empty:
-            has_c_d = table_has_creator("pending_doubles")
-            if has_c_d:
-                part_mask = (pdbl[["a1","a2","b1","b2"]].astype(str) == str(me)).any(axis=1)
-                my_conf_d = pdbl[part_mask & (pdbl["creator"].astype(str) != str(me))]
-            else:
-                my_conf_d = pdbl[(pdbl["a1"].astype(str) != str(me)) & ((pdbl["a2"].astype(str) == str(me)) | (pdbl["b1"].astype(str) == str(me)) | (pdbl["b2"].astype(str) == str(me)))]
-            for _, r in my_conf_d.iterrows():
-                info_rows_d.append(r)
-        # Rundlauf
-        if not pr.empty:
-            has_c_r = table_has_creator("pending_rounds")
-            if has_c_r:
-                def _involved_not_creator(row):
-                    teiln = [x for x in str(row.get("teilnehmer","")) .split(";") if x]
-                    return (str(me) in teiln) and (str(row.get("creator")) != str(me))
-                my_conf_r = pr[pr.apply(_involved_not_creator, axis=1)]
-            else:
-                def _is_involved_not_creator(row):
-                    teiln = [x for x in str(row.get("teilnehmer","")) .split(";") if x]
-                    return (str(me) in teiln) and (len(teiln) > 0 and teiln[0] != str(me))
-                my_conf_r = pr[pr.apply(_is_involved_not_creator, axis=1)]
-            for _, r in my_conf_r.iterrows():
-                info_rows_r.append(r)
+        # Bereits in der Übersicht (gleicher Rerun) gesammelt – kein zweiter Durchlauf nötig
 
         # --- Global: Alle bestätigen (unter dem Refresh-Button) ---
         if any([info_rows_s, info_rows_d, info_rows_r]):
@@ -1220,7 +1299,7 @@ def logged_in_ui():
                 r, id_to_name,
                 highlight_name=me_name,
                 key=f"trej_s_{r['id']}",
-                on_reject=lambda rid: (reject_pending("pending_matches", rid), clear_table_cache(), st.rerun()),
+                on_reject=lambda rid: (reject_pending("pending_matches", rid), clear_table_cache(("pending_matches",)), st.rerun()),
                 button_label="❌ Ablehnen",
             )
 
@@ -1231,7 +1310,7 @@ def logged_in_ui():
                 r, id_to_name,
                 highlight_name=me_name,
                 key=f"trej_d_{r['id']}",
-                on_reject=lambda rid: (reject_pending("pending_doubles", rid), clear_table_cache(), st.rerun()),
+                on_reject=lambda rid: (reject_pending("pending_doubles", rid), clear_table_cache(("pending_doubles",)), st.rerun()),
                 button_label="❌ Ablehnen",
             )
 
@@ -1242,59 +1321,39 @@ def logged_in_ui():
                 r, id_to_name,
                 highlight_name=me_name,
                 key=f"trej_r_{r['id']}",
-                on_reject=lambda rid: (reject_pending("pending_rounds", rid), clear_table_cache(), st.rerun()),
+                on_reject=lambda rid: (reject_pending("pending_rounds", rid), clear_table_cache(("pending_rounds",)), st.rerun()),
                 button_label="❌ Ablehnen",
             )
 
         # --- Von mir erstellt (ich kann abbrechen) ---
         st.markdown("### Ausstehende Bestätigungen")
-        if not pm.empty:
-            if table_has_creator("pending_matches"):
-                mine = pm[pm["creator"].astype(str) == str(me)]
-            else:
-                mine = pm[pm["a"].astype(str) == str(me)]
-            me_name = user.get("name")
-            for _, r in mine.iterrows():
-                render_single_vs_card(
-                    r, id_to_name,
-                    highlight_name=me_name,
-                    key=f"cancel_s_{r['id']}",
-                    on_reject=lambda rid: (reject_pending("pending_matches", rid), clear_table_cache(), st.rerun()),
-                    button_label="❌ Ablehnen",
-                )
+        me_name = user.get("name")
+        for r in mine_s:
+            render_single_vs_card(
+                r, id_to_name,
+                highlight_name=me_name,
+                key=f"cancel_s_{r['id']}",
+                on_reject=lambda rid: (reject_pending("pending_matches", rid), clear_table_cache(("pending_matches",)), st.rerun()),
+                button_label="❌ Ablehnen",
+            )
 
-        if not pdbl.empty:
-            if table_has_creator("pending_doubles"):
-                mine = pdbl[pdbl["creator"].astype(str) == str(me)]
-            else:
-                mine = pdbl[pdbl["a1"].astype(str) == str(me)]
-            me_name = user.get("name")
-            for _, r in mine.iterrows():
-                render_double_vs_card(
-                    r, id_to_name,
-                    highlight_name=me_name,
-                    key=f"cancel_d_{r['id']}",
-                    on_reject=lambda rid: (reject_pending("pending_doubles", rid), clear_table_cache(), st.rerun()),
-                    button_label="❌ Ablehnen",
-                )
+        for r in mine_d:
+            render_double_vs_card(
+                r, id_to_name,
+                highlight_name=me_name,
+                key=f"cancel_d_{r['id']}",
+                on_reject=lambda rid: (reject_pending("pending_doubles", rid), clear_table_cache(("pending_doubles",)), st.rerun()),
+                button_label="❌ Ablehnen",
+            )
 
-        if not pr.empty:
-            if table_has_creator("pending_rounds"):
-                mine = pr[pr["creator"].astype(str) == str(me)]
-            else:
-                def _created_by_me(row):
-                    teiln = [x for x in str(row.get("teilnehmer","")) .split(";") if x]
-                    return len(teiln) > 0 and teiln[0] == str(me)
-                mine = pr[pr.apply(_created_by_me, axis=1)]
-            me_name = user.get("name")
-            for _, r in mine.iterrows():
-                render_round_vs_card(
-                    r, id_to_name,
-                    highlight_name=me_name,
-                    key=f"cancel_r_{r['id']}",
-                    on_reject=lambda rid: (reject_pending("pending_rounds", rid), clear_table_cache(), st.rerun()),
-                    button_label="❌ Ablehnen",
-                )
+        for r in mine_r:
+            render_round_vs_card(
+                r, id_to_name,
+                highlight_name=me_name,
+                key=f"cancel_r_{r['id']}",
+                on_reject=lambda rid: (reject_pending("pending_rounds", rid), clear_table_cache(("pending_rounds",)), st.rerun()),
+                button_label="❌ Ablehnen",
+            )
 
     # Account – mit Logout‑Button
     with tabs[2]:
@@ -1325,14 +1384,7 @@ def logged_in_ui():
                     try:
                         sp.table("players").update({"name": nn}).eq("id", me_id).execute()
                         # Caches leeren & Session aktualisieren
-                        try:
-                            load_table.clear()
-                        except Exception:
-                            pass
-                        try:
-                            get_player_maps.clear()
-                        except Exception:
-                            pass
+                        clear_table_cache()
                         st.session_state.player_name = nn
                         st.success("Name aktualisiert.")
                         st.rerun()
@@ -1360,6 +1412,7 @@ def logged_in_ui():
                 try:
                     hp = hash_pin(new_pin1)
                     sp.table("players").update({"pin": hp}).eq("id", user.get("id")).execute()
+                    load_player.clear()
                     st.success("PIN aktualisiert.")
                     st.rerun()
                 except Exception as e: